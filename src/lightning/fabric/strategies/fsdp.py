@@ -57,9 +57,11 @@ from lightning.fabric.strategies.strategy import (
 )
 from lightning.fabric.utilities.distributed import (
     ReduceOp,
+    _broadcast_object,
     _distributed_is_initialized,
     _get_default_process_group_backend_for_device,
     _init_dist_connection,
+    _PendingAllReduce,
     _sync_ddp_if_available,
 )
 from lightning.fabric.utilities.distributed import group as _group
@@ -136,6 +138,10 @@ class FSDPStrategy(ParallelStrategy, _Sharded):
             - ``"sharded"``: Each rank saves its shard of weights and optimizer states to a file. The checkpoint is
               a folder with as many files as the world size.
 
+        gradient_compression: Compress gradients to half precision for the reduction across processes, halving
+            the communication payload compared to full-precision gradients. Accepts ``"fp16"`` or ``"bf16"``;
+            parameters and optimizer states are unaffected.
+
         \**kwargs: See available parameters in :class:`torch.distributed.fsdp.FullyShardedDataParallel`.
 
     """
@@ -156,6 +162,7 @@ class FSDPStrategy(ParallelStrategy, _Sharded):
         sharding_strategy: "_SHARDING_STRATEGY" = "FULL_SHARD",
         state_dict_type: Literal["full", "sharded"] = "sharded",
         device_mesh: Optional[Union[Tuple[int], "DeviceMesh"]] = None,
+        gradient_compression: Optional[Literal["fp16", "bf16"]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(
@@ -185,6 +192,12 @@ class FSDPStrategy(ParallelStrategy, _Sharded):
         self.sharding_strategy = _init_sharding_strategy(sharding_strategy, self._fsdp_kwargs)
         self.cpu_offload = _init_cpu_offload(cpu_offload)
         self.mixed_precision = mixed_precision
+        if gradient_compression not in (None, "fp16", "bf16"):
+            raise ValueError(
+                f"`gradient_compression={gradient_compression!r}` is not supported."
+                " Choose one of: None, 'fp16', 'bf16'."
+            )
+        self._gradient_compression = gradient_compression
 
     @property
     @override
@@ -314,6 +327,9 @@ class FSDPStrategy(ParallelStrategy, _Sharded):
         # activation checkpointing needs to be set up after wrapping the model
         _setup_activation_checkpointing(module, self._activation_checkpointing_kwargs)
 
+        if self._gradient_compression is not None:
+            _register_gradient_compression_hook(module, self._gradient_compression)
+
         return module
 
     @override
@@ -369,16 +385,25 @@ class FSDPStrategy(ParallelStrategy, _Sharded):
 
     @override
     def all_reduce(
-        self, tensor: Tensor, group: Optional[Any] = None, reduce_op: Optional[Union[ReduceOp, str]] = "mean"
-    ) -> Tensor:
+        self,
+        tensor: Tensor,
+        group: Optional[Any] = None,
+        reduce_op: Optional[Union[ReduceOp, str]] = "mean",
+        async_op: bool = False,
+    ) -> Union[Tensor, "_PendingAllReduce"]:
         if isinstance(tensor, Tensor):
-            return _sync_ddp_if_available(tensor, group, reduce_op=reduce_op)
+            # with `async_op` this returns a handle to `wait()` on, already completed when distributed
+            # is not initialized, so callers can treat the opt-in API uniformly
+            return _sync_ddp_if_available(tensor, group, reduce_op=reduce_op, async_op=async_op)
         return tensor
 
     @override
     def barrier(self, *args: Any, **kwargs: Any) -> None:
         if not _distributed_is_initialized():
             return
+        if torch.distributed.get_world_size() <= 1:
+            # a single process has nothing to synchronize with; skip the kernel launch and round-trip
+            return
         if torch.distributed.get_backend() == "nccl":
             torch.distributed.barrier(device_ids=[self.root_device.index])
         else:
@@ -389,9 +414,9 @@ class FSDPStrategy(ParallelStrategy, _Sharded):
         if not _distributed_is_initialized():
             return obj
 
-        obj = [obj]
-        torch.distributed.broadcast_object_list(obj, src, group=_group.WORLD)
-        return obj[0]
+        # a single fused size+payload broadcast halves the number of collectives for small objects
+        device = self.root_device if torch.distributed.get_backend() == "nccl" else torch.device("cpu")
+        return _broadcast_object(obj, src, device=device, group=_group.WORLD)
 
     @override
     def clip_gradients_norm(
@@ -664,6 +689,12 @@ class FSDPStrategy(ParallelStrategy, _Sharded):
         )
 
     def _setup_distributed(self) -> None:
+        if _distributed_is_initialized():
+            # the process group was created externally (e.g., by a surrounding framework); reuse it instead of
+            # paying the NCCL handshake again
+            self._set_world_ranks()
+            self._process_group_backend = torch.distributed.get_backend()
+            return
         reset_seed()
         self._set_world_ranks()
         self._process_group_backend = self._get_process_group_backend()
@@ -743,6 +774,40 @@ def _setup_activation_checkpointing(module: Module, activation_checkpointing_kwa
     apply_activation_checkpointing(module, checkpoint_wrapper_fn=checkpoint_wrapper, **activation_checkpointing_kwargs)
 
 
+def _register_gradient_compression_hook(module: Module, compression: str) -> None:
+    """Registers a communication hook that casts gradients to half precision for the reduction.
+
+    Compressing the gradients halves the bytes that go over the interconnect; the hook casts back to the
+    parameter dtype after the collective completes.
+
+    """
+    from torch.distributed.algorithms._comm_hooks import default_hooks
+    from torch.distributed.fsdp import FullyShardedDataParallel
+
+    hook = default_hooks.fp16_compress_hook if compression == "fp16" else default_hooks.bf16_compress_hook
+
+    # with manual wrapping, the root module may not be an FSDP instance itself; registering on each outermost
+    # wrapper covers all nested FSDP states without double registration
+    outermost: List[Module] = []
+    stack: List[Module] = [module]
+    while stack:
+        submodule = stack.pop()
+        if isinstance(submodule, FullyShardedDataParallel):
+            outermost.append(submodule)
+        else:
+            stack.extend(submodule.children())
+    if not outermost:
+        raise ValueError(
+            "Gradient compression requires the model to be wrapped in `FullyShardedDataParallel`, but no wrapped"
+            " module was found."
+        )
+    for submodule in outermost:
+        # reduce in the wrapper's own process group, which may differ from the world group (e.g. hybrid
+        # sharding or a custom `process_group`/`device_mesh`)
+        state = default_hooks.LowPrecisionState(process_group=submodule.process_group)
+        submodule.register_comm_hook(state, hook)
+
+
 class _FSDPBackwardSyncControl(_BackwardSyncControl):
     @override
     def no_backward_sync(self, module: Module, enabled: bool) -> ContextManager:
@@ -210,7 +210,11 @@ class XLAFSDPStrategy(ParallelStrategy, _Sharded):
         from torch_xla.distributed.fsdp import XlaFullyShardedDataParallel as XLAFSDP
 
         kwargs = self._parse_fsdp_kwargs()
-        if any(isinstance(mod, XLAFSDP) for mod in module.modules()) and "auto_wrap_policy" in kwargs:
+        # a module we wrapped before carries the marker, saving the full submodule scan on repeated setup
+        if "auto_wrap_policy" in kwargs and (
+            getattr(module, "_lightning_xla_fsdp_wrapped", False)
+            or any(isinstance(mod, XLAFSDP) for mod in module.modules())
+        ):
             rank_zero_warn(
                 "A XLAFSDP `auto_wrap_policy` is set, but at least one submodule is already wrapped."
                 " The policy will be ignored."
@@ -219,6 +223,7 @@ class XLAFSDPStrategy(ParallelStrategy, _Sharded):
         # XLA FSDP requires that the root is wrapped, even if submodules are already wrapped
         if not isinstance(module, XLAFSDP):
             module = XLAFSDP(module=module, **kwargs)
+        module._lightning_xla_fsdp_wrapped = True
         return module
 
     @override
@@ -349,6 +354,10 @@ class XLAFSDPStrategy(ParallelStrategy, _Sharded):
                 "Currently, the XLAFSDPStrategy only supports `sum`, `mean`, `avg` for the reduce operation, got:"
                 f" {reduce_op}"
             )
+        if self.world_size == 1:
+            # skip the XLA collective (and its compilation cache entry): the sum or mean over one replica is a no-op
+            return output
+
         import torch_xla.core.xla_model as xm
 
         output = xm.mesh_reduce("reduce", output, sum)
@@ -386,9 +395,12 @@ class XLAFSDPStrategy(ParallelStrategy, _Sharded):
         else:
             # support for arbitrary pickle-ables
             buffer = io.BytesIO()
-            torch.save(obj, buffer)
-            obj = torch.tensor(  # type: ignore[assignment]
-                bytearray(buffer.getbuffer()), device=self.root_device, dtype=torch.float
+            # the legacy format avoids the zipfile archive overhead for these small in-memory payloads
+            torch.save(obj, buffer, _use_new_zipfile_serialization=False)
+            # view the serialized bytes as uint8 instead of casting them to float, which would inflate the
+            # collective payload 4x and copy the buffer an extra time
+            obj = torch.frombuffer(buffer.getbuffer(), dtype=torch.uint8).to(  # type: ignore[assignment]
+                self.root_device
             )
 
         obj = [obj]
@@ -397,8 +409,8 @@ class XLAFSDPStrategy(ParallelStrategy, _Sharded):
 
         if not is_tensor:
             # this will preserve the dtype and device of any tensors
-            buffer = io.BytesIO(obj.cpu().byte().numpy())
-            obj = torch.load(buffer)
+            # the payload is already uint8, so no intermediate `.byte()` cast or extra host copy is needed
+            obj = torch.load(io.BytesIO(obj.cpu().numpy()))
         else:
             obj = obj.to(original_device)
 
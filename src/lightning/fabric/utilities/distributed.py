@@ -2,8 +2,10 @@ import atexit
 import contextlib
 import logging
 import os
+import pickle
 import signal
 import time
+from collections import OrderedDict
 from contextlib import nullcontext
 from datetime import timedelta
 from pathlib import Path
@@ -121,47 +123,97 @@ def _gather_all_tensors(result: Tensor, group: Optional[Any] = None) -> List[Ten
     result = result.contiguous()
 
     world_size = torch.distributed.get_world_size(group)
-    torch.distributed.barrier(group=group)
+
+    # A single process has nothing to exchange, not even shape metadata
+    if world_size == 1:
+        return [result]
 
     # If the tensor is scalar, things are easy
     if result.ndim == 0:
         return _simple_gather_all_tensors(result, group, world_size)
 
-    # 1. Gather sizes of all tensors
-    local_size = torch.tensor(result.shape, device=result.device)
-    local_sizes = [torch.zeros_like(local_size) for _ in range(world_size)]
-    torch.distributed.all_gather(local_sizes, local_size, group=group)
-    max_size = torch.stack(local_sizes).max(dim=0).values
-    all_sizes_equal = all(all(ls == max_size) for ls in local_sizes)
+    # 1. Exchange the tensor shapes. Shape metadata is a handful of integers, so all the padding math below
+    # runs on host-side Python ints. NCCL requires device-resident buffers, so the exchange goes through a
+    # single fused device collective plus one transfer back; other backends exchange the shapes directly.
+    # The shape and data gathers cannot be coalesced with each other, because the padding depends on the
+    # gathered shapes.
+    if torch.distributed.get_backend(group) == "nccl":
+        local_size = torch.tensor(result.shape, device=result.device)
+        stacked_sizes = torch.empty(world_size, result.ndim, dtype=local_size.dtype, device=local_size.device)
+        torch.distributed.all_gather_into_tensor(stacked_sizes, local_size, group=group)
+        shapes = [tuple(shape) for shape in stacked_sizes.cpu().tolist()]
+    else:
+        shapes = [None] * world_size
+        torch.distributed.all_gather_object(shapes, tuple(result.shape), group=group)
+    max_shape = tuple(map(max, zip(*shapes)))
+    all_sizes_equal = all(shape == max_shape for shape in shapes)
 
     # 2. If shapes are all the same, then do a simple gather:
     if all_sizes_equal:
         return _simple_gather_all_tensors(result, group, world_size)
 
-    # 3. If not, we need to pad each local tensor to maximum size, gather and then truncate
-    pad_dims = []
-    pad_by = (max_size - local_size).detach().cpu()
-    for val in reversed(pad_by):
-        pad_dims.append(0)
-        pad_dims.append(val.item())
-    result_padded = F.pad(result, pad_dims)
-    gathered_result = [torch.zeros_like(result_padded) for _ in range(world_size)]
-    torch.distributed.all_gather(gathered_result, result_padded, group)
-    for idx, item_size in enumerate(local_sizes):
-        slice_param = [slice(dim_size) for dim_size in item_size]
+    # 3. If not, we need to pad each local tensor to maximum size through a reusable buffer, gather and then truncate
+    result_padded = _zero_padded_copy(result, max_shape)
+    if torch.distributed.get_backend(group) == "nccl":
+        # gather into one contiguous buffer, skipping the per-rank zero fills and the staging copy of the list API
+        gathered = torch.empty((world_size, *max_shape), dtype=result.dtype, device=result.device)
+        torch.distributed.all_gather_into_tensor(gathered, result_padded, group=group)
+        gathered_result = list(gathered.unbind(0))
+    else:
+        gathered_result = [torch.zeros_like(result_padded) for _ in range(world_size)]
+        torch.distributed.all_gather(gathered_result, result_padded, group)
+    for idx, shape in enumerate(shapes):
+        slice_param = [slice(dim_size) for dim_size in shape]
         gathered_result[idx] = gathered_result[idx][slice_param]
     return gathered_result
 
 
+# reusable zero-padded send buffers for variable-shape gathers, keyed by shape, dtype and device
+_PAD_BUFFER_CACHE: "OrderedDict[tuple, Tensor]" = OrderedDict()
+_PAD_BUFFER_CACHE_MAXSIZE = 4
+
+
+def _zero_padded_copy(result: Tensor, max_shape: tuple) -> Tensor:
+    """Copy ``result`` into the leading slice of a zero-filled buffer of shape ``max_shape``.
+
+    The buffer is cached and reused across calls so repeated variable-shape gathers do not allocate a fresh
+    padded tensor each time.
+
+    """
+    key = (max_shape, result.dtype, str(result.device))
+    buffer = _PAD_BUFFER_CACHE.pop(key, None)
+    if buffer is None:
+        buffer = torch.zeros(max_shape, dtype=result.dtype, device=result.device)
+    else:
+        buffer.zero_()
+    _PAD_BUFFER_CACHE[key] = buffer
+    while len(_PAD_BUFFER_CACHE) > _PAD_BUFFER_CACHE_MAXSIZE:
+        _PAD_BUFFER_CACHE.popitem(last=False)
+    target = buffer
+    for dim, size in enumerate(result.shape):
+        target = target.narrow(dim, 0, size)
+    target.copy_(result)
+    return buffer
+
+
 def _simple_gather_all_tensors(result: Tensor, group: Any, world_size: int) -> List[Tensor]:
+    if torch.distributed.get_backend(group) == "nccl":
+        # one contiguous output buffer instead of world_size zero-filled tensors; the returned list holds
+        # views into it, so no extra copy is needed if the caller stacks them again
+        gathered = torch.empty((world_size, *result.shape), dtype=result.dtype, device=result.device)
+        torch.distributed.all_gather_into_tensor(gathered, result.contiguous(), group=group)
+        return list(gathered.unbind(0))
     gathered_result = [torch.zeros_like(result) for _ in range(world_size)]
     torch.distributed.all_gather(gathered_result, result, group)
     return gathered_result
 
 
 def _sync_ddp_if_available(
-    result: Tensor, group: Optional[Any] = None, reduce_op: Optional[Union[ReduceOp, str]] = None
-) -> Tensor:
+    result: Tensor,
+    group: Optional[Any] = None,
+    reduce_op: Optional[Union[ReduceOp, str]] = None,
+    async_op: bool = False,
+) -> Union[Tensor, "_PendingAllReduce"]:
     """Function to reduce a tensor across worker processes during distributed training.
 
     Args:
@@ -169,45 +221,51 @@ def _sync_ddp_if_available(
         group: The process group to gather results from. Defaults to all processes (world)
         reduce_op: The reduction operation. Defaults to sum.
             Can also be a string of 'avg', 'mean' to calculate the mean during reduction.
+        async_op: Whether to return immediately with a :class:`_PendingAllReduce` handle instead of blocking
+            until the collective completes, allowing compute to overlap with the reduction.
 
     Return:
-        reduced value
+        The reduced value, or a handle to it if ``async_op`` is set.
 
     """
     if _distributed_is_initialized():
-        return _sync_ddp(result, group=group, reduce_op=reduce_op)
-    return result
+        return _sync_ddp(result, group=group, reduce_op=reduce_op, async_op=async_op)
+    return _PendingAllReduce(result) if async_op else result
 
 
-def _sync_ddp(result: Tensor, group: Optional[Any] = None, reduce_op: Optional[Union[ReduceOp, str]] = None) -> Tensor:
+def _sync_ddp(
+    result: Tensor,
+    group: Optional[Any] = None,
+    reduce_op: Optional[Union[ReduceOp, str]] = None,
+    async_op: bool = False,
+) -> Union[Tensor, "_PendingAllReduce"]:
     """Reduces a tensor across several distributed processes.
 
     This operation is performed in-place, meaning the result will be placed back into the input tensor on all processes.
+    The collective itself synchronizes the participating processes; no separate barrier is issued.
 
     Args:
         result: The value to sync and reduce (typically tensor or number)
         group: The process group to gather results from. Defaults to all processes (world)
         reduce_op: The reduction operation. Defaults to sum.
             Can also be a string of 'avg', 'mean' to calculate the mean during reduction.
+        async_op: Whether to return immediately with a :class:`_PendingAllReduce` handle instead of blocking
+            until the collective completes.
 
     Return:
-        The reduced value.
+        The reduced value, or a handle to it if ``async_op`` is set.
 
     """
-    divide_by_world_size = False
+    if async_op:
+        return _sync_ddp_async(result, group=group, reduce_op=reduce_op)
     group = torch.distributed.group.WORLD if group is None else group
 
-    op: Optional[ReduceOp]
-    if isinstance(reduce_op, str):
-        reduce_op = "avg" if reduce_op == "mean" else reduce_op
-        if reduce_op.lower() == "avg" and torch.distributed.get_backend(group) == "gloo":
-            # The GLOO backend does not support the `ReduceOp.AVG` operation
-            op = ReduceOp.SUM  # type: ignore[assignment]
-            divide_by_world_size = True
-        else:
-            op = getattr(ReduceOp, reduce_op.upper())
-    else:
-        op = reduce_op
+    # a single process has nothing to reduce with, and the mean divide would be a no-op
+    world_size = torch.distributed.get_world_size(group)
+    if world_size == 1:
+        return result
+
+    op, divide_by_world_size = _convert_reduce_op(reduce_op, group)
 
     # HPU doesn't support Long types, forcefully set it to float
     # TODO: move this to the `lightning_habana` package
@@ -223,10 +281,8 @@ def _sync_ddp(result: Tensor, group: Optional[Any] = None, reduce_op: Optional[U
         rank_zero_info("Long tensor unsupported on HPU, casting to float")
         result = result.float()
 
-    # Sync all processes before reduction
-    torch.distributed.barrier(group=group)
+    # No explicit barrier needed here: the all-reduce itself synchronizes the participating processes
     torch.distributed.all_reduce(result, op=op, group=group, async_op=False)
-    world_size = torch.distributed.get_world_size(group)
 
     if not divide_by_world_size:
         return result
@@ -237,6 +293,78 @@ def _sync_ddp(result: Tensor, group: Optional[Any] = None, reduce_op: Optional[U
     return result.div_(world_size)
 
 
+def _convert_reduce_op(reduce_op: Optional[Union[ReduceOp, str]], group: Any) -> tuple:
+    """Map a string reduce-op to the ``torch.distributed`` enum, working around missing backend support.
+
+    Returns the operation and whether the caller has to divide the result by the world size manually (the GLOO
+    backend does not support ``ReduceOp.AVG``).
+
+    """
+    divide_by_world_size = False
+    op: Optional[ReduceOp]
+    if isinstance(reduce_op, str):
+        reduce_op = "avg" if reduce_op == "mean" else reduce_op
+        if reduce_op.lower() == "avg" and (
+            torch.distributed.get_backend(group) == "gloo" or not hasattr(ReduceOp, "AVG")
+        ):
+            # The GLOO backend does not support the `ReduceOp.AVG` operation, and old builds may lack it entirely
+            op = ReduceOp.SUM  # type: ignore[assignment]
+            divide_by_world_size = True
+        else:
+            op = getattr(ReduceOp, reduce_op.upper())
+    else:
+        op = reduce_op
+    return op, divide_by_world_size
+
+
+class _PendingAllReduce:
+    """Handle to an all-reduce launched with ``async_op=True``.
+
+    The reduction happens in-place on the wrapped tensor. Call :meth:`wait` before reading the result; any
+    computation issued between launching the reduction and waiting on it overlaps with the collective. With
+    ``work=None`` the handle is already complete, e.g. when distributed was never initialized.
+
+    """
+
+    def __init__(self, tensor: Tensor, work: Optional[Any] = None, divisor: int = 1) -> None:
+        self.tensor = tensor
+        self._work = work
+        self._divisor = divisor
+
+    def wait(self) -> Tensor:
+        if self._work is not None:
+            self._work.wait()
+        if self._divisor > 1:
+            if torch.is_floating_point(self.tensor):
+                self.tensor.div_(self._divisor)
+            else:
+                self.tensor.copy_(self.tensor / self._divisor)
+            self._divisor = 1
+        return self.tensor
+
+
+def _sync_ddp_async(
+    result: Tensor, group: Optional[Any] = None, reduce_op: Optional[Union[ReduceOp, str]] = None
+) -> _PendingAllReduce:
+    """Launch an in-place all-reduce without blocking on its completion.
+
+    Args:
+        result: The value to sync and reduce (typically tensor or number)
+        group: The process group to gather results from. Defaults to all processes (world)
+        reduce_op: The reduction operation. Defaults to sum.
+            Can also be a string of 'avg', 'mean' to calculate the mean during reduction.
+
+    Return:
+        A :class:`_PendingAllReduce` whose ``wait()`` returns the reduced tensor.
+
+    """
+    group = torch.distributed.group.WORLD if group is None else group
+    op, divide_by_world_size = _convert_reduce_op(reduce_op, group)
+    work = torch.distributed.all_reduce(result, op=op, group=group, async_op=True)
+    divisor = torch.distributed.get_world_size(group) if divide_by_world_size else 1
+    return _PendingAllReduce(result, work, divisor)
+
+
 def _all_gather_ddp_if_available(
     tensor: Tensor, group: Optional["torch.distributed.ProcessGroup"] = None, sync_grads: bool = False
 ) -> Tensor:
@@ -254,14 +382,69 @@ def _all_gather_ddp_if_available(
     if not _distributed_is_initialized():
         return tensor
 
+    tensor = tensor.contiguous()  # https://github.com/pytorch/pytorch/issues/73515
+
+    # a single process only gathers from itself, no collective needed
+    if torch.distributed.get_world_size(group) == 1:
+        return tensor.unsqueeze(0)
+
+    if not sync_grads and torch.distributed.get_backend(group) == "nccl":
+        # without gradients there is no need for the autograd-aware per-rank list: gather straight into
+        # the stacked output buffer, saving world_size intermediate tensors and the stack copy
+        world_size = torch.distributed.get_world_size(group)
+        gathered = torch.empty((world_size, *tensor.shape), dtype=tensor.dtype, device=tensor.device)
+        torch.distributed.all_gather_into_tensor(gathered, tensor, group=group)
+        return gathered
+
     from torch.distributed.nn.functional import all_gather
 
-    tensor = tensor.contiguous()  # https://github.com/pytorch/pytorch/issues/73515
     with nullcontext() if sync_grads else torch.no_grad():
         gathered_tensors = all_gather(tensor, group)
     return torch.stack(gathered_tensors)
 
 
+# fast-path buffer for object broadcasts: 8-byte length header followed by the pickled payload
+_OBJECT_BROADCAST_BUFFER_SIZE = 1024 * 1024
+_OBJECT_BROADCAST_HEADER_SIZE = 8
+_OBJECT_BROADCAST_OVERFLOW = (1 << (8 * _OBJECT_BROADCAST_HEADER_SIZE)) - 1
+
+
+def _broadcast_object(obj: Any, src: int, device: torch.device, group: Optional[Any] = None) -> Any:
+    """Broadcast a pickleable object with a single collective for small payloads.
+
+    ``torch.distributed.broadcast_object_list`` issues two broadcasts per call: one for the payload sizes and one for
+    the data. Packing a length header and the pickled bytes into a single fixed-size buffer halves the number of kernel
+    launches and network round-trips for small control-plane objects such as paths and metadata dicts. Objects that do
+    not fit in the buffer fall back to the two-step protocol.
+
+    """
+    group = torch.distributed.group.WORLD if group is None else group
+    header = _OBJECT_BROADCAST_HEADER_SIZE
+    buffer = torch.empty(_OBJECT_BROADCAST_BUFFER_SIZE, dtype=torch.uint8, device=device)
+    is_src = torch.distributed.get_rank() == src
+    overflow = False
+    if is_src:
+        data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+        overflow = header + len(data) > _OBJECT_BROADCAST_BUFFER_SIZE
+        size = _OBJECT_BROADCAST_OVERFLOW if overflow else len(data)
+        packed = bytearray(size.to_bytes(header, "little"))
+        if not overflow:
+            packed += data
+        buffer[: len(packed)] = torch.frombuffer(packed, dtype=torch.uint8)
+    torch.distributed.broadcast(buffer, src, group=group)
+    if not is_src:
+        received = buffer.cpu().numpy()
+        size = int.from_bytes(received[:header].tobytes(), "little")
+        overflow = size == _OBJECT_BROADCAST_OVERFLOW
+        if not overflow:
+            return pickle.loads(received[header : header + size].tobytes())
+    if overflow:
+        obj_list = [obj]
+        torch.distributed.broadcast_object_list(obj_list, src, group=group)
+        return obj_list[0]
+    return obj
+
+
 def _init_dist_connection(
     cluster_environment: "ClusterEnvironment",
     torch_distributed_backend: str,
@@ -324,6 +507,8 @@ def _get_default_process_group_backend_for_device(device: torch.device) -> str:
 class _DatasetSamplerWrapper(Dataset):
     """Dataset to create indexes from `Sampler` or `Iterable`"""
 
+    __slots__ = ("_sampler", "_sampler_indices", "_len")
+
     def __init__(self, sampler: Union[Sampler, Iterable]) -> None:
         if not isinstance(sampler, Sized):
             raise TypeError(
@@ -344,21 +529,54 @@ class _DatasetSamplerWrapper(Dataset):
                 " or set `use_distributed_sampler=False` if you want to handle distributed sampling yourself."
             )
         self._sampler = sampler
-        # defer materializing an iterator until it is necessary
-        self._sampler_list: Optional[List[Any]] = None
+        # defer materializing the sampler until an index is requested
+        self._sampler_indices: Optional[Any] = None
+        # the DataLoader queries the length on every index computation, don't re-enter the sampler each time
+        self._len = len(sampler)
 
     @override
     def __getitem__(self, index: int) -> Any:
-        if self._sampler_list is None:
-            self._sampler_list = list(self._sampler)
-        return self._sampler_list[index]
+        if hasattr(self._sampler, "__getitem__"):
+            # the sampler supports random access directly, no need to cache anything
+            return self._sampler[index]
+        if self._sampler_indices is None:
+            self._sampler_indices = self._materialize()
+        if isinstance(self._sampler_indices, list):
+            return self._sampler_indices[index]
+        # the numpy cache holds `numpy.int64` items; hand plain ints to the dataset like the sampler would
+        return int(self._sampler_indices[index])
+
+    def _materialize(self) -> Any:
+        # integer indices (the common case) pack into a numpy array at 8 bytes per element instead of a
+        # full Python object each; samplers yielding anything else fall back to a plain list
+        from lightning.fabric.utilities.imports import _NUMPY_AVAILABLE
+
+        if _NUMPY_AVAILABLE:
+            import numpy as np
+
+            try:
+                return np.fromiter(self._sampler, dtype=np.int64, count=len(self._sampler))
+            except (TypeError, ValueError):
+                pass
+        return list(self._sampler)
+
+    def select(self, indices: List[int]) -> Any:
+        """Look up many indices at once, using a single vectorized gather when the cache supports it."""
+        if hasattr(self._sampler, "__getitem__"):
+            return [self._sampler[index] for index in indices]
+        if self._sampler_indices is None:
+            self._sampler_indices = self._materialize()
+        if isinstance(self._sampler_indices, list):
+            return [self._sampler_indices[index] for index in indices]
+        # `tolist` converts back to plain Python ints so no `numpy.int64` leaks into user datasets
+        return self._sampler_indices[indices].tolist()
 
     def __len__(self) -> int:
-        return len(self._sampler)
+        return self._len
 
     def reset(self) -> None:
-        """Reset the sampler list in order to get new sampling."""
-        self._sampler_list = list(self._sampler)
+        """Invalidate the cached indices so that the next access samples anew."""
+        self._sampler_indices = None
 
 
 class DistributedSamplerWrapper(DistributedSampler):
@@ -380,7 +598,7 @@ class DistributedSamplerWrapper(DistributedSampler):
     @override
     def __iter__(self) -> Iterator:
         self.dataset.reset()
-        return (self.dataset[index] for index in super().__iter__())
+        return iter(self.dataset.select(list(super().__iter__())))
 
 
 def _suggested_max_num_threads(num_processes: int = 1) -> int:
@@ -396,11 +614,16 @@ def _set_num_threads_if_needed(num_processes: int = 1) -> None:
         os.environ["OMP_NUM_THREADS"] = str(num_threads)
 
 
+# distributed support is a build-time property of torch, so it never changes within a process. The
+# initialized state is not cached: process groups can be destroyed and recreated at runtime.
+_TORCH_DISTRIBUTED_AVAILABLE = torch.distributed.is_available()
+
+
 def _distributed_is_initialized() -> bool:
     # `is_initialized` is only defined conditionally
     # https://github.com/pytorch/pytorch/blob/v2.1.0/torch/distributed/__init__.py#L25
     # this might happen to MacOS builds from source (default) or any build from source that sets `USE_DISTRIBUTED=0`
-    return torch.distributed.is_available() and torch.distributed.is_initialized()
+    return _TORCH_DISTRIBUTED_AVAILABLE and torch.distributed.is_initialized()
 
 
 class _InfiniteBarrier:
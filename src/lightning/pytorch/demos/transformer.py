@@ -12,7 +12,6 @@ from typing import Dict, List, Optional, Tuple
 
 import torch
 import torch.nn as nn
-import torch.nn.functional as F
 from lightning_utilities.core.imports import RequirementCache
 from torch import Tensor
 from torch.nn.modules import MultiheadAttention
@@ -52,23 +51,36 @@ class Transformer(nn.Module):
         )
         self.decoder = nn.Linear(ninp, vocab_size)
 
+        # absorb the sqrt(ninp) embedding scale into the weights once, instead of multiplying every forward;
+        # this scales the initial weight distribution by sqrt(ninp)
+        with torch.no_grad():
+            self.embedding.weight.mul_(math.sqrt(ninp))
+
         self.ninp = ninp
         self.vocab_size = vocab_size
         self.src_mask = None
+        self._mask_cache: Dict[Tuple[int, torch.device], Tensor] = {}
 
     def forward(self, inputs: Tensor, target: Tensor, mask: Optional[Tensor] = None) -> Tensor:
         _, t = inputs.shape
 
         # we assume target is already shifted w.r.t. inputs
+        is_causal = False
         if mask is None:
-            mask = torch.tril(torch.ones(t, t, device=inputs.device)) == 1
-            mask = mask.float().masked_fill(mask == 0, float("-inf")).masked_fill(mask == 1, 0.0)
-
-        src = self.pos_encoder(self.embedding(inputs) * math.sqrt(self.ninp))
-        target = self.pos_encoder(self.embedding(target) * math.sqrt(self.ninp))
-        output = self.transformer(src, target, tgt_mask=mask)
+            # the mask only depends on the sequence length, which is fixed per dataset - build it once
+            key = (t, inputs.device)
+            mask = self._mask_cache.get(key)
+            if mask is None:
+                mask = nn.Transformer.generate_square_subsequent_mask(t, device=inputs.device)
+                self._mask_cache[key] = mask
+            # the hint lets scaled_dot_product_attention dispatch to the fused causal (flash) kernels
+            is_causal = True
+
+        src = self.pos_encoder(self.embedding(inputs))
+        target = self.pos_encoder(self.embedding(target))
+        output = self.transformer(src, target, tgt_mask=mask, tgt_is_causal=is_causal)
+        # return the raw logits: the loss uses `cross_entropy`, which fuses the log-softmax into a single kernel
         output = self.decoder(output)
-        output = F.log_softmax(output, dim=-1)
         output = output.view(-1, self.vocab_size)
         return output
 
@@ -80,6 +92,8 @@ class PositionalEncoding(nn.Module):
         self.dim = dim
         self.max_len = max_len
         self.pe: Optional[Tensor] = None
+        self._pe_slice: Optional[Tensor] = None
+        self._pe_slice_len = -1
 
     def forward(self, x: Tensor) -> Tensor:
         if self.pe is None:
@@ -88,7 +102,11 @@ class PositionalEncoding(nn.Module):
             # TODO: Could make this a `nn.Parameter` with `requires_grad=False`
             self.pe = self._init_pos_encoding(device=x.device)
 
-        x = x + self.pe[: x.size(0), :]
+        # inputs have a fixed length in the common case, so reuse the sliced view across steps
+        if self._pe_slice_len != x.size(0):
+            self._pe_slice = self.pe[: x.size(0)]
+            self._pe_slice_len = x.size(0)
+        x = x + self._pe_slice
         return self.dropout(x)
 
     def _init_pos_encoding(self, device: torch.device) -> Tensor:
@@ -111,6 +129,10 @@ class WikiText2(Dataset):
             self.download(self.path)
         self.data, self.dictionary = tokenize(self.path)
         self.block_size = block_size
+        # pre-slice the flat token stream into (num_samples, block_size) views so `__getitem__` is a row index
+        num_samples = len(self.data) // block_size - 1
+        self._inputs = self.data.narrow(0, 0, num_samples * block_size).view(num_samples, block_size)
+        self._targets = self.data.narrow(0, 1, num_samples * block_size).view(num_samples, block_size)
 
     @property
     def vocab_size(self) -> int:
@@ -120,11 +142,7 @@ class WikiText2(Dataset):
         return len(self.data) // self.block_size - 1
 
     def __getitem__(self, index: int) -> Tuple[Tensor, Tensor]:
-        start = index * self.block_size
-        end = start + self.block_size
-        inputs = self.data[start:end]
-        target = self.data[(start + 1) : (end + 1)]
-        return inputs, target
+        return self._inputs[index], self._targets[index]
 
     @staticmethod
     def download(destination: Path) -> None:
@@ -137,8 +155,11 @@ class WikiText2(Dataset):
         url = "https://raw.githubusercontent.com/pytorch/examples/main/word_language_model/data/wikitext-2/train.txt"
         if os.path.exists(destination):
             return
-        with open(destination, "w") as f:
-            f.write(requests.get(url).text)
+        # stream to disk in chunks instead of decoding the entire corpus into one Python string first
+        with requests.get(url, stream=True) as r, open(destination, "wb") as f:
+            for chunk in r.iter_content(chunk_size=1 << 20):
+                if chunk:
+                    f.write(chunk)
 
 
 class Dictionary:
@@ -160,24 +181,21 @@ def tokenize(path: Path) -> Tuple[Tensor, Dictionary]:
     dictionary = Dictionary()
 
     assert os.path.exists(path)
-    # Add words to the dictionary
-    with open(path, encoding="utf8") as f:
-        for line in f:
-            words = line.split() + ["<eos>"]
-            for word in words:
-                dictionary.add_word(word)
-
-    # Tokenize file content
+    # build the vocabulary and the id sequence in a single pass over the file
+    word2idx = dictionary.word2idx
+    idx2word = dictionary.idx2word
+    ids: List[int] = []
     with open(path, encoding="utf8") as f:
-        idss: List[Tensor] = []
         for line in f:
-            words = line.split() + ["<eos>"]
-            ids: List[int] = []
-            for word in words:
-                ids.append(dictionary.word2idx[word])
-            idss.append(torch.tensor(ids).type(torch.int64))
+            for word in line.split() + ["<eos>"]:
+                idx = word2idx.get(word)
+                if idx is None:
+                    idx = len(idx2word)
+                    idx2word.append(word)
+                    word2idx[word] = idx
+                ids.append(idx)
 
-    return torch.cat(idss), dictionary
+    return torch.tensor(ids, dtype=torch.int64), dictionary
 
 
 class LightningTransformer(LightningModule):
@@ -191,7 +209,7 @@ class LightningTransformer(LightningModule):
     def training_step(self, batch: Tuple[Tensor, Tensor], batch_idx: int) -> Tensor:
         inputs, target = batch
         output = self(inputs, target)
-        loss = torch.nn.functional.nll_loss(output, target.view(-1))
+        loss = torch.nn.functional.cross_entropy(output, target.view(-1))
         return loss
 
     def configure_optimizers(self) -> torch.optim.Optimizer:
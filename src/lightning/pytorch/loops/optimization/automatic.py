@@ -13,7 +13,7 @@
 # limitations under the License.
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Any, Callable, Dict, Mapping, Optional, OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional
 
 import torch
 from torch import Tensor
@@ -158,7 +158,7 @@ class _AutomaticOptimization(_Loop):
         self.optim_progress: _OptimizationProgress = _OptimizationProgress()
         self._skip_backward: bool = False
 
-    def run(self, optimizer: Optimizer, batch_idx: int, kwargs: OrderedDict) -> _OUTPUTS_TYPE:
+    def run(self, optimizer: Optimizer, batch_idx: int, kwargs: Dict[str, Any]) -> _OUTPUTS_TYPE:
         """Runs closure (train step + backward) together with optimization if necessary.
 
         Args:
@@ -194,7 +194,7 @@ class _AutomaticOptimization(_Loop):
             return {}
         return result.asdict()
 
-    def _make_closure(self, kwargs: OrderedDict, optimizer: Optimizer, batch_idx: int) -> Closure:
+    def _make_closure(self, kwargs: Dict[str, Any], optimizer: Optimizer, batch_idx: int) -> Closure:
         """Build a closure object that captures the given arguments and runs the `training_step` function and
         optionally other functions such as `backward` and `zero_grad`."""
         step_fn = self._make_step_fn(kwargs)
@@ -202,7 +202,7 @@ class _AutomaticOptimization(_Loop):
         zero_grad_fn = self._make_zero_grad_fn(batch_idx, optimizer)
         return Closure(step_fn=step_fn, backward_fn=backward_fn, zero_grad_fn=zero_grad_fn)
 
-    def _make_step_fn(self, kwargs: OrderedDict) -> Callable[[], ClosureResult]:
+    def _make_step_fn(self, kwargs: Dict[str, Any]) -> Callable[[], ClosureResult]:
         """Build the step function that runs the `training_step` and processes its output."""
         return partial(self._training_step, kwargs)
 
@@ -302,7 +302,7 @@ class _AutomaticOptimization(_Loop):
         call._call_lightning_module_hook(trainer, "optimizer_zero_grad", trainer.current_epoch, batch_idx, optimizer)
         self.optim_progress.optimizer.zero_grad.increment_completed()
 
-    def _training_step(self, kwargs: OrderedDict) -> ClosureResult:
+    def _training_step(self, kwargs: Dict[str, Any]) -> ClosureResult:
         """Performs the actual train step with the tied hooks.
 
         Args:
@@ -11,7 +11,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from collections import OrderedDict
 from contextlib import suppress
 from dataclasses import dataclass, field
 from typing import Any, Dict
@@ -88,7 +87,7 @@ class _ManualOptimization(_Loop):
 
         self._output: _OUTPUTS_TYPE = {}
 
-    def run(self, kwargs: OrderedDict) -> _OUTPUTS_TYPE:
+    def run(self, kwargs: Dict[str, Any]) -> _OUTPUTS_TYPE:
         self.on_run_start()
         with suppress(StopIteration):  # no loop to break at this level
             self.advance(kwargs)
@@ -101,7 +100,7 @@ class _ManualOptimization(_Loop):
             lightning_optimizer._on_before_step = self._on_before_step
             lightning_optimizer._on_after_step = self._on_after_step
 
-    def advance(self, kwargs: OrderedDict) -> None:
+    def advance(self, kwargs: Dict[str, Any]) -> None:
         """Performs the training step for manual optimization.
 
         Args:
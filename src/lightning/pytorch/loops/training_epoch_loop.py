@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import math
-from collections import OrderedDict
 from typing import Any, Dict, Optional, Union
 
 from typing_extensions import override
@@ -21,6 +20,7 @@ import lightning.pytorch as pl
 from lightning.fabric.utilities.types import _Stateful
 from lightning.fabric.utilities.warnings import PossibleUserWarning
 from lightning.pytorch import loops  # import as loops to avoid circular imports
+from lightning.pytorch.callbacks import Callback
 from lightning.pytorch.loops.fetchers import _DataFetcher, _DataLoaderIterDataFetcher
 from lightning.pytorch.loops.optimization import _AutomaticOptimization, _ManualOptimization
 from lightning.pytorch.loops.optimization.automatic import _OUTPUTS_TYPE as _OPTIMIZER_LOOP_OUTPUTS_TYPE
@@ -81,6 +81,20 @@ class _TrainingEpochLoop(loops._Loop):
         self._results = _ResultCollection(training=True)
         self._warning_cache = WarningCache()
         self._batches_that_stepped: int = 0
+        self._pass_batch_idx_to_step = False
+        self._automatic_optimization = True
+        self._accumulate_grad_batches = 1
+        self._ready_batches = 0
+        self._has_plateau_schedulers = True
+        self._has_non_plateau_schedulers = True
+        self._scheduler_configs_by_kind: Dict[tuple, list] = {}
+        self._on_train_batch_start_hooks: tuple = ()
+        self._on_train_batch_end_hooks: tuple = ()
+        self._check_val_this_epoch = True
+        self._infinite_train_dataset = False
+        self._val_check_on_limited_batches = False
+        self._module_overrides_batch_end = True
+        self._batch_lookahead: Optional[Any] = None
 
     @property
     def total_batch_idx(self) -> int:
@@ -105,8 +119,11 @@ class _TrainingEpochLoop(loops._Loop):
 
     @property
     def _is_training_done(self) -> bool:
-        max_steps_reached = _is_max_limit_reached(self.global_step, self.max_steps)
-        return max_steps_reached or self._num_ready_batches_reached()
+        # check the batch counters first: the `global_step` property walks the optimization loop's progress
+        # tracking and is only needed when a step limit is actually set
+        if self._num_ready_batches_reached():
+            return True
+        return self.max_steps != -1 and _is_max_limit_reached(self.global_step, self.max_steps)
 
     @property
     def _is_validation_done(self) -> bool:
@@ -182,6 +199,91 @@ class _TrainingEpochLoop(loops._Loop):
         data_fetcher.fetched += self.batch_progress.current.ready
         data_fetcher._start_profiler = self._on_before_fetch
         data_fetcher._stop_profiler = self._on_after_fetch
+        # any batch fetched ahead belonged to the previous epoch's iterator
+        self._batch_lookahead = None
+
+        # resolve the `training_step` signature once per epoch instead of introspecting it for every batch
+        training_step_fx = getattr(self.trainer.lightning_module, "training_step")
+        self._pass_batch_idx_to_step = is_param_in_hook_signature(training_step_fx, "batch_idx", min_args=2)
+
+        # cache per-epoch invariants so the per-batch path avoids repeated chained property lookups. This runs
+        # after the `on_train_epoch_start` hooks, so a `GradientAccumulationScheduler` update is picked up
+        self._automatic_optimization = self.trainer.lightning_module.automatic_optimization
+        self._accumulate_grad_batches = self.trainer.accumulate_grad_batches
+        # plain-int mirror of `batch_progress.current.ready` so the per-batch checks below skip the nested
+        # progress-dataclass lookups; resynced here in case a restart adjusted the progress tracking
+        self._ready_batches = self.batch_progress.current.ready
+        lr_scheduler_configs = self.trainer.lr_scheduler_configs
+        self._has_plateau_schedulers = any(config.reduce_on_plateau for config in lr_scheduler_configs)
+        self._has_non_plateau_schedulers = any(not config.reduce_on_plateau for config in lr_scheduler_configs)
+        # group the scheduler configs by interval and plateau-ness once, so the per-batch update walks a
+        # pre-filtered list instead of re-testing every config
+        self._scheduler_configs_by_kind = {
+            (interval, plateau): [
+                config
+                for config in lr_scheduler_configs
+                if config.interval == interval and config.reduce_on_plateau == plateau
+            ]
+            for interval in ("step", "epoch")
+            for plateau in (False, True)
+        }
+
+        # pre-bind the per-batch callback hooks, skipping callbacks that inherit the no-op default, so the
+        # per-batch dispatch iterates a short tuple of bound methods instead of re-filtering on every call
+        self._on_train_batch_start_hooks = self._resolve_batch_callback_hooks("on_train_batch_start")
+        self._on_train_batch_end_hooks = self._resolve_batch_callback_hooks("on_train_batch_end")
+        # same bound-attribute check as for the callbacks: skip the module hook dispatch if it's the default
+        self._module_overrides_batch_end = (
+            getattr(self.trainer.lightning_module.on_train_batch_end, "__func__", None)
+            is not pl.LightningModule.on_train_batch_end
+        )
+
+        # precompute the epoch-constant pieces of the validation-check predicate
+        self._check_val_this_epoch = self._should_check_val_epoch()
+        self._infinite_train_dataset = self.trainer.val_check_batch == float("inf")
+        self._val_check_on_limited_batches = (
+            isinstance(self.trainer.limit_train_batches, int) and self._infinite_train_dataset
+        )
+
+    def _resolve_batch_callback_hooks(self, hook_name: str) -> tuple:
+        """Collect the callbacks that actually implement the given hook, as ``(state_key, bound_method)`` pairs.
+
+        The check goes through the bound attribute so that hooks patched onto an instance are still picked up.
+
+        """
+        default = getattr(Callback, hook_name)
+        resolved = []
+        for callback in self.trainer.callbacks:
+            fn = getattr(callback, hook_name)
+            if callable(fn) and getattr(fn, "__func__", None) is not default:
+                resolved.append((callback.state_key, fn))
+        return tuple(resolved)
+
+    def _call_batch_callback_hooks(self, hook_name: str, hooks: tuple, *args: Any) -> None:
+        """Slimmed-down version of :func:`~lightning.pytorch.trainer.call._call_callback_hooks` that dispatches
+        over the hooks pre-resolved in :meth:`on_run_start`."""
+        trainer = self.trainer
+        pl_module = trainer.lightning_module
+        prev_fx_name = pl_module._current_fx_name
+        pl_module._current_fx_name = hook_name
+        for state_key, fn in hooks:
+            with trainer.profiler.profile(f"[Callback]{state_key}.{hook_name}"):
+                fn(trainer, pl_module, *args)
+        pl_module._current_fx_name = prev_fx_name
+
+    def _emit_batch_end(self, batch_output: _BATCH_OUTPUTS_TYPE, batch: Any, batch_idx: int) -> None:
+        """Emit the end-of-batch callback hooks, module hook and logger update in one tight sequence.
+
+        The LightningModule dispatch is skipped entirely when the module keeps the no-op default.
+
+        """
+        self._call_batch_callback_hooks(
+            "on_train_batch_end", self._on_train_batch_end_hooks, batch_output, batch, batch_idx
+        )
+        trainer = self.trainer
+        if self._module_overrides_batch_end:
+            call._call_lightning_module_hook(trainer, "on_train_batch_end", batch_output, batch, batch_idx)
+        trainer._logger_connector.on_batch_end()
 
     def _on_before_fetch(self) -> None:
         self.trainer.profiler.start(f"[{self.__class__.__name__}].train_dataloader_next")
@@ -209,7 +311,12 @@ class _TrainingEpochLoop(loops._Loop):
             batch_idx = data_fetcher._batch_idx
         else:
             dataloader_iter = None
-            batch, _, __ = next(data_fetcher)
+            if self._batch_lookahead is not None:
+                # consume the batch requested ahead at the end of the previous `advance`
+                batch, _, __ = self._batch_lookahead
+                self._batch_lookahead = None
+            else:
+                batch, _, __ = next(data_fetcher)
             # TODO: we should instead use the batch_idx returned by the fetcher, however, that will require saving the
             # fetcher state so that the batch_idx is correct after restarting
             batch_idx = self.batch_idx + 1
@@ -223,6 +330,7 @@ class _TrainingEpochLoop(loops._Loop):
             batch = call._call_strategy_hook(trainer, "batch_to_device", batch, dataloader_idx=0)
 
         self.batch_progress.increment_ready()
+        self._ready_batches += 1
         trainer._logger_connector.on_batch_start(batch)
 
         batch_output: _BATCH_OUTPUTS_TYPE = None  # for mypy
@@ -230,7 +338,7 @@ class _TrainingEpochLoop(loops._Loop):
             self._warning_cache.warn("train_dataloader yielded None. If this was on purpose, ignore this warning...")
         else:
             # hook
-            call._call_callback_hooks(trainer, "on_train_batch_start", batch, batch_idx)
+            self._call_batch_callback_hooks("on_train_batch_start", self._on_train_batch_start_hooks, batch, batch_idx)
             response = call._call_lightning_module_hook(trainer, "on_train_batch_start", batch, batch_idx)
             call._call_strategy_hook(trainer, "on_train_batch_start", batch, batch_idx)
             if response == -1:
@@ -240,12 +348,12 @@ class _TrainingEpochLoop(loops._Loop):
             self.batch_progress.increment_started()
 
             kwargs = (
-                self._build_kwargs(OrderedDict(), batch, batch_idx)
+                self._build_kwargs({}, batch, batch_idx)
                 if not using_dataloader_iter
-                else OrderedDict(any=dataloader_iter)
+                else {"any": dataloader_iter}
             )
             with trainer.profiler.profile("run_training_batch"):
-                if trainer.lightning_module.automatic_optimization:
+                if self._automatic_optimization:
                     # in automatic optimization, there can only be one optimizer
                     batch_output = self.automatic_optimization.run(trainer.optimizers[0], batch_idx, kwargs)
                 else:
@@ -266,9 +374,7 @@ class _TrainingEpochLoop(loops._Loop):
             # update `is_last_batch` again after dataloader_iter was fetched in `training_step()`
             self.batch_progress.is_last_batch = data_fetcher.done
 
-        call._call_callback_hooks(trainer, "on_train_batch_end", batch_output, batch, batch_idx)
-        call._call_lightning_module_hook(trainer, "on_train_batch_end", batch_output, batch, batch_idx)
-        trainer._logger_connector.on_batch_end()
+        self._emit_batch_end(batch_output, batch, batch_idx)
 
         self.batch_progress.increment_completed()
 
@@ -310,6 +416,20 @@ class _TrainingEpochLoop(loops._Loop):
         if not self._is_training_done and self.trainer.received_sigterm:
             raise SIGTERMException
 
+        if (
+            not isinstance(data_fetcher, _DataLoaderIterDataFetcher)
+            and not self._is_training_done
+            and not self.trainer.should_stop
+        ):
+            # request the next batch while the device may still be executing this step's kernels, so draining
+            # the dataloader-worker queue overlaps with compute instead of blocking the next `advance`. this
+            # must run after validation and any checkpointing it triggers: a stateful dataloader would
+            # otherwise record the fetched-but-unconsumed batch, and `should_stop` may have just been set
+            try:
+                self._batch_lookahead = next(data_fetcher)
+            except StopIteration:
+                self._batch_lookahead = None
+
     def teardown(self) -> None:
         self._results.cpu()
         self.val_loop.teardown()
@@ -326,10 +446,12 @@ class _TrainingEpochLoop(loops._Loop):
 
     def _accumulated_batches_reached(self) -> bool:
         """Determine if accumulation will be finished by the end of the current batch."""
-        return self.batch_progress.current.ready % self.trainer.accumulate_grad_batches == 0
+        return self._ready_batches % self._accumulate_grad_batches == 0
 
     def _num_ready_batches_reached(self) -> bool:
         """Checks if we are in the last batch or if there are more batches to follow."""
+        # read the live counters: `done` is also evaluated outside a running epoch, where the per-epoch
+        # mirrors resynced in `on_run_start` would be stale
         epoch_finished_on_ready = self.batch_progress.current.ready == self.trainer.num_training_batches
         return epoch_finished_on_ready or self.batch_progress.is_last_batch
 
@@ -344,6 +466,9 @@ class _TrainingEpochLoop(loops._Loop):
 
     def update_lr_schedulers(self, interval: str, update_plateau_schedulers: bool) -> None:
         """Updates the lr schedulers based on the given interval."""
+        # nothing to do for models without a matching scheduler, skip before any per-batch bookkeeping
+        if not (self._has_plateau_schedulers if update_plateau_schedulers else self._has_non_plateau_schedulers):
+            return
         if interval == "step" and self._should_accumulate():
             return
         self._update_learning_rates(interval=interval, update_plateau_schedulers=update_plateau_schedulers)
@@ -364,15 +489,21 @@ class _TrainingEpochLoop(loops._Loop):
         if not trainer.lr_scheduler_configs or not trainer.lightning_module.automatic_optimization:
             return
 
-        for config in trainer.lr_scheduler_configs:
-            if update_plateau_schedulers ^ config.reduce_on_plateau:
-                continue
-
-            current_idx = self.batch_idx if interval == "step" else trainer.current_epoch
-            current_idx += 1  # account for both batch and epoch starts from 0
-            # Take step if call to update_learning_rates matches the interval key and
-            # the current step modulo the schedulers frequency is zero
-            if config.interval == interval and current_idx % config.frequency == 0:
+        configs = self._scheduler_configs_by_kind.get((interval, update_plateau_schedulers))
+        if configs is None:
+            # called outside an epoch run, filter the live list
+            configs = [
+                config
+                for config in trainer.lr_scheduler_configs
+                if config.interval == interval and config.reduce_on_plateau == update_plateau_schedulers
+            ]
+
+        current_idx = self.batch_idx if interval == "step" else trainer.current_epoch
+        current_idx += 1  # account for both batch and epoch starts from 0
+
+        for config in configs:
+            # Take step if the current step modulo the schedulers frequency is zero
+            if current_idx % config.frequency == 0:
                 monitor_val = None
                 if config.reduce_on_plateau:
                     monitor_key = config.monitor
@@ -416,14 +547,18 @@ class _TrainingEpochLoop(loops._Loop):
         )
 
     def _should_check_val_fx(self, data_fetcher: _DataFetcher) -> bool:
-        """Decide if we should run validation."""
-        if not self._should_check_val_epoch():
+        """Decide if we should run validation.
+
+        The epoch-constant pieces of this predicate are precomputed in ``on_run_start``; only ``should_stop``
+        and the batch counters are evaluated per call.
+
+        """
+        if not self._check_val_this_epoch:
             return False
 
         # val_check_batch is inf for iterable datasets with no length defined
-        is_infinite_dataset = self.trainer.val_check_batch == float("inf")
         is_last_batch = self.batch_progress.is_last_batch
-        if is_last_batch and (is_infinite_dataset or isinstance(data_fetcher, _DataLoaderIterDataFetcher)):
+        if is_last_batch and (self._infinite_train_dataset or isinstance(data_fetcher, _DataLoaderIterDataFetcher)):
             return True
 
         if self.trainer.should_stop and self.trainer.fit_loop._can_stop_early:
@@ -433,9 +568,9 @@ class _TrainingEpochLoop(loops._Loop):
 
         # TODO: let training/eval loop handle logic around limit_*_batches and val_check_batch
         is_val_check_batch = is_last_batch
-        if isinstance(self.trainer.limit_train_batches, int) and is_infinite_dataset:
+        if self._val_check_on_limited_batches:
             is_val_check_batch = (self.batch_idx + 1) % self.trainer.limit_train_batches == 0
-        elif self.trainer.val_check_batch != float("inf"):
+        elif not self._infinite_train_dataset:
             # if `check_val_every_n_epoch is `None`, run a validation loop every n training batches
             # else condition it based on the batch_idx of the current epoch
             current_iteration = self.total_batch_idx if self.trainer.check_val_every_n_epoch is None else self.batch_idx
@@ -449,7 +584,7 @@ class _TrainingEpochLoop(loops._Loop):
             for logger in self.trainer.loggers:
                 logger.save()
 
-    def _build_kwargs(self, kwargs: OrderedDict, batch: Any, batch_idx: int) -> OrderedDict:
+    def _build_kwargs(self, kwargs: Dict[str, Any], batch: Any, batch_idx: int) -> Dict[str, Any]:
         """Helper method to build the arguments for the current step.
 
         Args:
@@ -462,9 +597,8 @@ class _TrainingEpochLoop(loops._Loop):
 
         """
         kwargs["batch"] = batch
-        training_step_fx = getattr(self.trainer.lightning_module, "training_step")
         # the `batch_idx` is optional, but its name can be anything
         # as long as there are two arguments after 'self', we assume they are the `batch` and `batch_idx`
-        if is_param_in_hook_signature(training_step_fx, "batch_idx", min_args=2):
+        if self._pass_batch_idx_to_step:
             kwargs["batch_idx"] = batch_idx
         return kwargs
@@ -57,13 +57,16 @@ from lightning.fabric.strategies.fsdp import (
     _is_sharded_checkpoint,
     _move_torchmetrics_to_device,
     _optimizer_has_flat_params,
+    _register_gradient_compression_hook,
     _setup_activation_checkpointing,
 )
 from lightning.fabric.strategies.model_parallel import _load_raw_module_state
 from lightning.fabric.utilities.distributed import (
+    _broadcast_object,
     _distributed_is_initialized,
     _get_default_process_group_backend_for_device,
     _init_dist_connection,
+    _PendingAllReduce,
     _sync_ddp_if_available,
 )
 from lightning.fabric.utilities.distributed import group as _group
@@ -143,6 +146,10 @@ class FSDPStrategy(ParallelStrategy):
             - ``"sharded"``: Each rank saves its shard of weights and optimizer states to a file. The checkpoint is
               a folder with as many files as the world size.
 
+        gradient_compression: Compress gradients to half precision for the reduction across processes, halving
+            the communication payload compared to full-precision gradients. Accepts ``"fp16"`` or ``"bf16"``;
+            parameters and optimizer states are unaffected.
+
         \**kwargs: See available parameters in :class:`torch.distributed.fsdp.FullyShardedDataParallel`.
 
     """
@@ -167,6 +174,7 @@ class FSDPStrategy(ParallelStrategy):
         sharding_strategy: "_SHARDING_STRATEGY" = "FULL_SHARD",
         state_dict_type: Literal["full", "sharded"] = "full",
         device_mesh: Optional[Union[Tuple[int], "DeviceMesh"]] = None,
+        gradient_compression: Optional[Literal["fp16", "bf16"]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(
@@ -198,6 +206,12 @@ class FSDPStrategy(ParallelStrategy):
             activation_checkpointing, activation_checkpointing_policy
         )
         self._state_dict_type = state_dict_type
+        if gradient_compression not in (None, "fp16", "bf16"):
+            raise ValueError(
+                f"`gradient_compression={gradient_compression!r}` is not supported."
+                " Choose one of: None, 'fp16', 'bf16'."
+            )
+        self._gradient_compression = gradient_compression
 
     @property
     @override
@@ -259,14 +273,20 @@ class FSDPStrategy(ParallelStrategy):
     def setup_environment(self) -> None:
         super().setup_environment()
         log.debug(f"{self.__class__.__name__}: setting up distributed...")
-        reset_seed()
+        if _distributed_is_initialized():
+            # the process group was created externally (e.g., by a surrounding framework); reuse it instead of
+            # paying the NCCL handshake again
+            self.set_world_ranks()
+            self._process_group_backend = torch.distributed.get_backend()
+        else:
+            reset_seed()
 
-        # determine which process we are and world size
-        self.set_world_ranks()
+            # determine which process we are and world size
+            self.set_world_ranks()
 
-        self._process_group_backend = self._get_process_group_backend()
-        assert self.cluster_environment is not None
-        _init_dist_connection(self.cluster_environment, self._process_group_backend, timeout=self._timeout)
+            self._process_group_backend = self._get_process_group_backend()
+            assert self.cluster_environment is not None
+            _init_dist_connection(self.cluster_environment, self._process_group_backend, timeout=self._timeout)
 
         # if 'device_mesh' in the `kwargs` is provided as a tuple, update it into the `DeviceMesh` object here
         if isinstance(self.kwargs.get("device_mesh"), tuple):
@@ -324,6 +344,9 @@ class FSDPStrategy(ParallelStrategy):
         # activation checkpointing needs to be set up after wrapping the model
         _setup_activation_checkpointing(model, self._activation_checkpointing_kwargs)
 
+        if self._gradient_compression is not None:
+            _register_gradient_compression_hook(model, self._gradient_compression)
+
         return model
 
     @override
@@ -418,6 +441,9 @@ class FSDPStrategy(ParallelStrategy):
     def barrier(self, name: Optional[str] = None) -> None:
         if not _distributed_is_initialized():
             return
+        if torch.distributed.get_world_size() <= 1:
+            # a single process has nothing to synchronize with; skip the kernel launch and round-trip
+            return
         if torch.distributed.get_backend() == "nccl":
             torch.distributed.barrier(device_ids=self._determine_device_ids())
         else:
@@ -428,9 +454,9 @@ class FSDPStrategy(ParallelStrategy):
         if not _distributed_is_initialized():
             return obj
 
-        obj = [obj]
-        torch.distributed.broadcast_object_list(obj, src, group=_group.WORLD)
-        return obj[0]
+        # a single fused size+payload broadcast halves the number of collectives for small objects
+        device = self.root_device if torch.distributed.get_backend() == "nccl" else torch.device("cpu")
+        return _broadcast_object(obj, src, device=device, group=_group.WORLD)
 
     @override
     def reduce(
@@ -438,7 +464,8 @@ class FSDPStrategy(ParallelStrategy):
         tensor: Union[Tensor, Any],
         group: Optional[Any] = None,
         reduce_op: Optional[Union[ReduceOp, str]] = "mean",
-    ) -> Tensor:
+        async_op: bool = False,
+    ) -> Union[Tensor, "_PendingAllReduce"]:
         """Reduces a tensor from several distributed processes to one aggregated tensor.
 
         Args:
@@ -446,13 +473,17 @@ class FSDPStrategy(ParallelStrategy):
             group: the process group to gather results from. Defaults to all processes (world)
             reduce_op: the reduction operation. Defaults to 'mean'/'avg'.
                 Can also be a string 'sum' to calculate the sum during reduction.
+            async_op: launch the collective without blocking on it and return a handle to ``wait()`` on,
+                overlapping the reduction with computation issued in the meantime.
 
         Return:
             reduced value, except when the input was not a tensor the output remains is unchanged
 
         """
         if isinstance(tensor, Tensor):
-            return _sync_ddp_if_available(tensor, group, reduce_op=reduce_op)
+            # with `async_op` this returns a handle to `wait()` on, already completed when distributed
+            # is not initialized, so callers can treat the opt-in API uniformly
+            return _sync_ddp_if_available(tensor, group, reduce_op=reduce_op, async_op=async_op)
         return tensor
 
     def _determine_device_ids(self) -> List[int]:
@@ -40,6 +40,15 @@ def test_fsdp_precision_config(precision, expected):
     assert config.reduce_dtype == expected[2]
 
 
+def test_fsdp_precision_config_overrides():
+    plugin = FSDPPrecision(precision="bf16-mixed", reduce_dtype=torch.bfloat16, buffer_dtype=torch.float32)
+    config = plugin.mixed_precision_config
+
+    assert config.param_dtype == torch.float32
+    assert config.reduce_dtype == torch.bfloat16
+    assert config.buffer_dtype == torch.float32
+
+
 def test_fsdp_precision_default_scaler():
     from torch.distributed.fsdp.sharded_grad_scaler import ShardedGradScaler
 
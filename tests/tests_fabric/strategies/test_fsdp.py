@@ -26,6 +26,7 @@ from lightning.fabric.strategies.fsdp import (
     _FSDPBackwardSyncControl,
     _get_full_state_dict_context,
     _is_sharded_checkpoint,
+    _register_gradient_compression_hook,
 )
 from lightning.fabric.utilities.imports import _TORCH_GREATER_EQUAL_2_2
 from torch.distributed.fsdp.fully_sharded_data_parallel import CPUOffload, FullyShardedDataParallel, MixedPrecision
@@ -179,6 +180,37 @@ def test_activation_checkpointing():
     apply_mock.assert_called_with(wrapped, checkpoint_wrapper_fn=ANY, **strategy._activation_checkpointing_kwargs)
 
 
+def test_gradient_compression():
+    """Test that the compression hook gets registered on the outermost FSDP wrappers and invalid values raise."""
+    from torch.distributed.algorithms._comm_hooks import default_hooks
+
+    with pytest.raises(ValueError, match=escape("`gradient_compression='int8'` is not supported")):
+        FSDPStrategy(gradient_compression="int8")
+
+    # registered on the root wrapper, reducing in its own process group
+    module = MagicMock(spec=FullyShardedDataParallel)
+    module.process_group = Mock()
+    _register_gradient_compression_hook(module, "fp16")
+    state, hook = module.register_comm_hook.call_args[0]
+    assert hook is default_hooks.fp16_compress_hook
+    assert state.process_group is module.process_group
+
+    # with manual wrapping, registered on each outermost wrapper
+    inner = MagicMock(spec=FullyShardedDataParallel)
+    inner.process_group = Mock()
+    model = nn.Module()
+    model.layer0 = inner
+    model.layer1 = nn.Linear(2, 2)
+    _register_gradient_compression_hook(model, "bf16")
+    state, hook = inner.register_comm_hook.call_args[0]
+    assert hook is default_hooks.bf16_compress_hook
+    assert state.process_group is inner.process_group
+
+    # without any FSDP wrapper there is no communication to compress
+    with pytest.raises(ValueError, match="no wrapped module was found"):
+        _register_gradient_compression_hook(nn.Linear(2, 2), "bf16")
+
+
 def test_forbidden_precision_raises():
     with pytest.raises(TypeError, match="can only work with the `FSDPPrecision"):
         FSDPStrategy(precision=HalfPrecision())
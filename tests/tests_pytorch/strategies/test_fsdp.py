@@ -416,6 +416,12 @@ def test_forbidden_precision_raises():
         strategy.precision_plugin = HalfPrecision()
 
 
+def test_gradient_compression_invalid():
+    """Test that an unsupported gradient compression value raises."""
+    with pytest.raises(ValueError, match=escape("`gradient_compression='int8'` is not supported")):
+        FSDPStrategy(gradient_compression="int8")
+
+
 def test_activation_checkpointing():
     """Test that the FSDP strategy can apply activation checkpointing to the given layers."""
 
@@ -26,6 +26,7 @@ from tests_pytorch.helpers.runif import RunIf
     [
         ("deepspeed", {}),
         ("deepspeed_stage_1", {"stage": 1}),
+        ("deepspeed_stage_1_offload", {"stage": 1, "offload_optimizer": True}),
         ("deepspeed_stage_2", {"stage": 2}),
         ("deepspeed_stage_2_offload", {"stage": 2, "offload_optimizer": True}),
         ("deepspeed_stage_3", {"stage": 3}),